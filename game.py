@@ -1,14 +1,51 @@
+import time
+
+# Startup timing (seconds per phase), reported with --startup-report
+startup_times = {}
+_startup_start = time.perf_counter()
+
 import pygame
 import random
 import math
 import sys
+import os
+import json
+import threading
+import gc
+import tracemalloc
+import heapq
+import queue
+import atexit
+import tempfile
+from collections import OrderedDict
+
+startup_times['import'] = time.perf_counter() - _startup_start
+
+def get_option(name, default):
+    """Return the value of a --name=value command line option"""
+    prefix = f"--{name}="
+    for arg in sys.argv[1:]:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return default
+
+# Logical resolution (--resolution=WxH); positions and collisions always use these coordinates
+MIN_WIDTH, MIN_HEIGHT = 320, 240  # Smallest resolution the playfield works at
+try:
+    WIDTH, HEIGHT = (int(n) for n in get_option("resolution", "800x600").lower().split("x"))
+except ValueError:
+    WIDTH, HEIGHT = 800, 600
+if WIDTH < MIN_WIDTH or HEIGHT < MIN_HEIGHT:
+    WIDTH, HEIGHT = 800, 600
 
-# Initialize pygame
-pygame.init()
+# Menu screens are laid out at no less than 800x600 (keeping the aspect ratio) and scaled down to fit
+LAYOUT_SCALE = max(1, 800 / WIDTH, 600 / HEIGHT)
+LAYOUT_SIZE = (round(WIDTH * LAYOUT_SCALE), round(HEIGHT * LAYOUT_SCALE))
 
 # Game constants
-WIDTH, HEIGHT = 800, 600
 FPS = 60
+MENU_FPS = 30  # Menus only animate the starfield
+BACKGROUND_FPS = 10  # Frame rate while the window is not focused
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 RED = (231, 76, 60)
@@ -22,21 +59,513 @@ ENEMY_POINTS = 100
 LEVEL_UP_SCORE = 1000
 DOUBLE_BULLETS_LEVEL = 3
 
-# Create the screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Space Shooter")
-clock = pygame.time.Clock()
+# Directory for the font path cache and the leaderboard
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".space_shooter")
 
-# Load fonts
-try:
-    font_small = pygame.font.SysFont('arial', 16)
-    font_medium = pygame.font.SysFont('arial', 24)
-    font_large = pygame.font.SysFont('arial', 48)
-except:
-    # Fallback if font not available
-    font_small = pygame.font.Font(None, 16)
-    font_medium = pygame.font.Font(None, 24)
-    font_large = pygame.font.Font(None, 48)
+# Cache settings
+FONT_CACHE_FILE = os.path.join(DATA_DIR, "fonts.json")
+TEXT_CACHE_SIZE = 256
+SPRITE_CACHE_SIZE = 1024
+PARTICLE_ALPHA_STEP = 16  # Particle opacity is quantized so sprites can be reused
+
+# Garbage collection settings (used with --gc-scheduler)
+GC_MIN_SPARE = 0.004  # Seconds left in a frame needed to run a deferred collection
+GC_MAX_DEFERRED = 20  # Collect anyway once this many gen 0 thresholds have passed
+
+# Leaderboard settings
+LEADERBOARD_LOG = os.path.join(DATA_DIR, "scores.log")
+LEADERBOARD_SNAPSHOT = os.path.join(DATA_DIR, "scores.json")
+LEADERBOARD_TOP_K = 10  # Best runs kept in memory, overall and per ship
+LEADERBOARD_SHOWN = 3  # Best runs listed on the game over screen
+LEADERBOARD_COMPACT_EVERY = 10000  # Runs appended to the log before it is folded into the snapshot
+
+# Command line options
+STARTUP_REPORT = "--startup-report" in sys.argv
+PACING_REPORT = "--pacing-report" in sys.argv
+GC_SCHEDULER = "--gc-scheduler" in sys.argv
+ALLOC_REPORT = "--alloc-report" in sys.argv
+RENDER_REPORT = "--render-report" in sys.argv
+FULLSCREEN = "--fullscreen" in sys.argv
+SCALER = get_option("scaler", "scaled")  # scaled (GPU), integer (nearest neighbour) or none
+BENCHMARK_RUNS = get_option("benchmark-leaderboard", None)  # Time the leaderboard instead of playing
+
+# Render layers, drawn from lowest to highest
+LAYER_STARS = 0
+LAYER_PARTICLES = 1
+LAYER_BULLETS = 2
+LAYER_ENEMIES = 3
+LAYER_PLAYER = 4
+
+# Ship options shown on the selection screen
+SHIP_OPTIONS = [
+    {
+        'type': 'fighter',
+        'name': 'Fighter',
+        'desc': 'Balanced',
+        'color': BLUE,
+        'stats': {
+            'speed': 3,
+            'health': 3,
+            'damage': 3
+        }
+    },
+    {
+        'type': 'scout',
+        'name': 'Scout',
+        'desc': 'Fast & Agile',
+        'color': GREEN,
+        'stats': {
+            'speed': 5,
+            'health': 2,
+            'damage': 2
+        }
+    },
+    {
+        'type': 'tank',
+        'name': 'Tank',
+        'desc': 'Heavy & Powerful',
+        'color': RED,
+        'stats': {
+            'speed': 2,
+            'health': 5,
+            'damage': 4
+        }
+    }
+]
+
+class FramePacer:
+    """Frame rate limiter that throttles or pauses in the background and pauses while minimized"""
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+        self.focused = True
+        self.minimized = False
+        
+        self.frame_start = time.perf_counter()
+        self.paused_time = 0  # Total milliseconds spent in pause()
+        
+        # CPU time used per second of wall-clock time, updated once a second
+        self.cpu_usage = 0.0
+        self.report_wall = time.perf_counter()
+        self.report_cpu = time.process_time()
+
+    def handle_event(self, event):
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type == pygame.WINDOWMINIMIZED:
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED):
+            self.minimized = False
+
+    def get_events(self):
+        events = pygame.event.get()
+        for event in events:
+            self.handle_event(event)
+        return events
+
+    def wait_events(self, timeout=0):
+        """Block until an event arrives (or timeout ms pass) and return all pending events"""
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        for event in events:
+            self.handle_event(event)
+        self.update_cpu_usage()
+        return events
+
+    def tick(self, fps, pause_unfocused=False):
+        """Wait until the next frame is due
+
+        Menus keep animating at BACKGROUND_FPS when the window loses focus. Gameplay
+        passes pause_unfocused, since a lower frame rate would slow movement while
+        the wall-clock spawn timers keep running.
+        """
+        gc_scheduler.end_frame(1 / fps - (time.perf_counter() - self.frame_start))
+        if self.minimized or (pause_unfocused and not self.focused):
+            self.pause(pause_unfocused)
+        self.clock.tick(fps if self.focused else min(fps, BACKGROUND_FPS))
+        self.frame_start = time.perf_counter()
+        self.update_cpu_usage()
+
+    def pause(self, pause_unfocused):
+        # Sleep until the window is restored (and focused) or there is input to handle
+        start = pygame.time.get_ticks()
+        while self.minimized or (pause_unfocused and not self.focused):
+            event = pygame.event.wait()
+            self.handle_event(event)
+            if event.type in (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP):
+                pygame.event.post(event)
+                break
+        self.paused_time += pygame.time.get_ticks() - start
+
+    def update_cpu_usage(self):
+        wall = time.perf_counter()
+        if wall - self.report_wall >= 1:
+            cpu = time.process_time()
+            self.cpu_usage = (cpu - self.report_cpu) / (wall - self.report_wall)
+            self.report_wall = wall
+            self.report_cpu = cpu
+            if PACING_REPORT:
+                print(f"CPU: {self.cpu_usage * 1000:.0f} ms/s, {self.clock.get_fps():.0f} FPS")
+
+class GCScheduler:
+    """Defers garbage collection during play to frames with time to spare"""
+    def __init__(self, enabled, report):
+        self.enabled = enabled
+        self.report = report
+        self.playing = False
+        self.scheduled = False  # True while running one of our own collections
+        self.collect_start = 0
+        self.last_count = 0
+        
+        # Per-frame telemetry
+        self.frame_gc_time = 0.0  # Time spent collecting during the current frame
+        self.frame_memory = 0  # Traced memory at the end of the previous frame
+        
+        # Telemetry, reset once a second
+        self.frames = 0
+        self.net_objects = 0
+        self.transient = 0
+        self.max_transient = 0
+        self.collections = 0
+        self.unscheduled = 0
+        self.max_pause = 0.0
+        self.max_frame_gc_time = 0.0
+        self.peak_memory = 0
+        self.report_time = time.perf_counter()
+        
+        if report:
+            gc.callbacks.append(self.on_gc)
+            tracemalloc.start()
+
+    def on_gc(self, phase, info):
+        if phase == 'start':
+            self.collect_start = time.perf_counter()
+        else:
+            pause = time.perf_counter() - self.collect_start
+            self.frame_gc_time += pause
+            self.collections += 1
+            self.max_pause = max(self.max_pause, pause)
+            if not self.scheduled:
+                self.unscheduled += 1
+
+    def collect(self, generation):
+        self.scheduled = True
+        gc.collect(generation)
+        self.scheduled = False
+        self.last_count = gc.get_count()[0]
+
+    def begin_play(self):
+        """Freeze everything created during setup and stop automatic collections"""
+        self.playing = True
+        if self.enabled:
+            self.collect(2)
+            gc.freeze()
+            gc.disable()
+
+    def end_play(self):
+        """Resume automatic collections and clean up while the menus are showing"""
+        self.playing = False
+        if self.enabled:
+            gc.unfreeze()
+            gc.enable()
+            self.collect(2)
+
+    def end_frame(self, spare):
+        count0, count1, _ = gc.get_count()
+        
+        # Net change in GC-tracked objects since the last frame (objects freed within the frame cancel out)
+        self.net_objects += count0 - self.last_count if count0 >= self.last_count else count0
+        self.last_count = count0
+        
+        if self.enabled and self.playing:
+            threshold0, threshold1, _ = gc.get_threshold()
+            if count0 >= threshold0 and (spare >= GC_MIN_SPARE or count0 >= threshold0 * GC_MAX_DEFERRED):
+                self.collect(1 if count1 >= threshold1 else 0)
+        
+        if self.report:
+            # Short-lived allocations show up as the traced peak rising above where the frame started
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            transient = max(0, peak - self.frame_memory)
+            self.frame_memory = current
+            
+            self.frames += 1
+            self.transient += transient
+            self.max_transient = max(self.max_transient, transient)
+            self.max_frame_gc_time = max(self.max_frame_gc_time, self.frame_gc_time)
+            self.frame_gc_time = 0.0
+            self.peak_memory = max(self.peak_memory, peak)
+            
+            now = time.perf_counter()
+            if now - self.report_time >= 1:
+                print(f"GC: {self.net_objects / self.frames:+.0f} net objects/frame, "
+                      f"{self.transient / self.frames / 1024:.1f} KB transient/frame "
+                      f"(max {self.max_transient / 1024:.1f} KB), "
+                      f"{self.collections} collections ({self.unscheduled} unscheduled), "
+                      f"GC time/frame max {self.max_frame_gc_time * 1000:.2f} ms, "
+                      f"longest pause {self.max_pause * 1000:.2f} ms, "
+                      f"memory {current / 1024:.0f} KB (peak {self.peak_memory / 1024:.0f} KB)")
+                self.frames = 0
+                self.net_objects = 0
+                self.transient = 0
+                self.max_transient = 0
+                self.collections = 0
+                self.unscheduled = 0
+                self.max_pause = 0.0
+                self.max_frame_gc_time = 0.0
+                self.peak_memory = 0
+                self.report_time = now
+
+SHIP_NAMES = {ship['type']: ship['name'] for ship in SHIP_OPTIONS}
+
+# The display, frame pacer and GC scheduler are created by init_display() when the game starts.
+# Everything is drawn on screen at the logical resolution; present() scales it to the window.
+screen = None
+display = None
+scaled_area = None
+pacer = None
+gc_scheduler = None
+
+def init_display():
+    global screen, display, scaled_area, pacer, gc_scheduler
+    start = time.perf_counter()
+    pygame.init()
+    flags = pygame.FULLSCREEN if FULLSCREEN else 0
+    
+    if SCALER == 'integer':
+        # Largest whole multiple of the logical size that fits, centered in the window
+        desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+        if FULLSCREEN:
+            display = pygame.display.set_mode((0, 0), flags)
+        else:
+            # Leave room for the window decorations
+            display = pygame.display.set_mode((desktop_width * 9 // 10, desktop_height * 9 // 10), flags)
+        scale = max(1, min(display.get_width() // WIDTH, display.get_height() // HEIGHT))
+        if not FULLSCREEN:
+            display = pygame.display.set_mode((WIDTH * scale, HEIGHT * scale), flags)
+        area = pygame.Rect(0, 0, WIDTH * scale, HEIGHT * scale)
+        area.center = display.get_rect().center
+        scaled_area = display.subsurface(area.clip(display.get_rect()))
+        screen = pygame.Surface((WIDTH, HEIGHT)).convert()
+    elif SCALER == 'none':
+        display = screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+    else:
+        # SDL scales the logical surface to the window on the GPU
+        display = screen = pygame.display.set_mode((WIDTH, HEIGHT), flags | pygame.SCALED)
+    
+    pygame.display.set_caption("Space Shooter")
+    pacer = FramePacer()
+    gc_scheduler = GCScheduler(GC_SCHEDULER, ALLOC_REPORT)
+    startup_times['init'] = time.perf_counter() - start
+
+def present():
+    """Show the finished frame, scaling it up to the window when needed"""
+    if scaled_area is not None:
+        pygame.transform.scale(screen, scaled_area.get_size(), scaled_area)
+        render_queue.count_draws()
+    pygame.display.flip()
+
+# Resolved font file paths, loaded from FONT_CACHE_FILE on first use
+_font_paths = None
+_font_lock = threading.Lock()
+
+def resolve_font_path(name):
+    """Return the file path of a system font, avoiding a fontconfig scan when cached"""
+    global _font_paths
+    if _font_paths is None:
+        try:
+            with open(FONT_CACHE_FILE) as f:
+                _font_paths = json.load(f)
+        except (OSError, ValueError):
+            _font_paths = {}
+
+    # None is cached too, meaning no system font matched and the default font is used
+    if name in _font_paths:
+        path = _font_paths[name]
+        if path is None or os.path.exists(path):
+            return path
+
+    path = pygame.font.match_font(name)
+    _font_paths[name] = path
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(FONT_CACHE_FILE, 'w') as f:
+            json.dump(_font_paths, f)
+    except OSError:
+        pass  # The cache is only an optimization
+    return path
+
+class LazyFont:
+    """Font that is loaded the first time it is used rather than at import"""
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self.font = None
+
+    def get(self):
+        if self.font is None:
+            with _font_lock:
+                if self.font is None:
+                    start = time.perf_counter()
+                    try:
+                        self.font = pygame.font.Font(resolve_font_path(self.name), self.size)
+                    except (OSError, pygame.error):
+                        # Fallback if font not available
+                        self.font = pygame.font.Font(None, self.size)
+                    startup_times['fonts'] = startup_times.get('fonts', 0) + time.perf_counter() - start
+        return self.font
+
+    def render(self, text, antialias, color):
+        return self.get().render(text, antialias, color)
+
+# Fonts
+font_small = LazyFont('arial', 16)
+font_medium = LazyFont('arial', 24)
+font_large = LazyFont('arial', 48)
+
+# Rendered text and sprite surfaces, keyed by everything that affects their pixels
+_text_cache = {}
+_sprite_cache = OrderedDict()  # Least recently used sprites first
+_sprite_lock = threading.Lock()  # Shared with prewarm_caches()
+
+def render_text(text, font, color):
+    key = (text, font, color)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        text_surface = font.render(text, True, color)
+        _text_cache[key] = text_surface
+    return text_surface
+
+def get_sprite(key, size, draw_func, *args):
+    """Return the cached sprite for key, calling draw_func(sprite, *args) to create it"""
+    with _sprite_lock:
+        sprite = _sprite_cache.get(key)
+        if sprite is not None:
+            _sprite_cache.move_to_end(key)
+            return sprite
+        
+        # Evict the least recently used sprites, so the ones drawn every frame stay cached
+        while len(_sprite_cache) >= SPRITE_CACHE_SIZE:
+            _sprite_cache.popitem(last=False)
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        draw_func(sprite, *args)
+        _sprite_cache[key] = sprite
+        return sprite
+
+def draw_bullet_sprite(surface, width, height, color):
+    pygame.draw.rect(surface, color, (3, 3, width, height))
+    
+    # Create a glow effect (simplified)
+    glow_surf = pygame.Surface((width + 6, height + 6), pygame.SRCALPHA)
+    pygame.draw.rect(glow_surf, (*color, 100), (3, 3, width, height))
+    surface.blit(glow_surf, (0, 0))
+
+def get_bullet_surface(width, height, color):
+    return get_sprite(('bullet', width, height, color), (width + 6, height + 6),
+                      draw_bullet_sprite, width, height, color)
+
+def get_circle_surface(radius, color):
+    return get_sprite(('circle', radius, color), (radius * 2, radius * 2),
+                      pygame.draw.circle, color, (radius, radius), radius)
+
+def get_particle_surface(size, color, opacity):
+    diameter = int(size * 2)
+    radius = int(size)
+    alpha = int(opacity) // PARTICLE_ALPHA_STEP * PARTICLE_ALPHA_STEP
+    return get_sprite(('particle', diameter, radius, color, alpha), (diameter, diameter),
+                      pygame.draw.circle, (*color, alpha), (radius, radius), radius)
+
+class RenderQueue:
+    """Collects sprites by layer and draws each layer with a single blits() call
+
+    It also keeps the frame's draw call count: its own blits() calls plus the fills,
+    text and HUD draws made directly on the screen, reported through count_draws().
+    """
+    def __init__(self):
+        self.layers = {}
+        
+        # Telemetry, reset once a second
+        self.frames = 0
+        self.draw_calls = 0
+        self.batches = 0
+        self.sprites = 0
+        self.report_time = time.perf_counter()
+
+    def count_draws(self, n=1):
+        self.draw_calls += n
+
+    def submit(self, layer, sprite, pos):
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append((sprite, pos))
+
+    def flush(self, surface):
+        for layer in sorted(self.layers):
+            items = self.layers[layer]
+            if not items:
+                continue
+            if hasattr(surface, 'fblits'):
+                surface.fblits(items)
+            else:
+                surface.blits(items, False)
+            self.draw_calls += 1
+            self.batches += 1
+            self.sprites += len(items)
+            items.clear()
+        
+        if RENDER_REPORT:
+            self.frames += 1
+            now = time.perf_counter()
+            if now - self.report_time >= 1:
+                print(f"Render: {self.draw_calls / self.frames:.1f} draw calls/frame, "
+                      f"of which {self.batches / self.frames:.1f} batched blits "
+                      f"for {self.sprites / self.frames:.0f} sprites")
+                self.frames = 0
+                self.draw_calls = 0
+                self.batches = 0
+                self.sprites = 0
+                self.report_time = now
+
+render_queue = RenderQueue()
+
+def prewarm_caches():
+    """Load fonts and render common text and sprites before they are first needed"""
+    for font in (font_small, font_medium, font_large):
+        font.get()
+
+    # Ship selection text
+    render_text("SELECT YOUR SHIP", font_large, BLUE)
+    render_text("← → to select, SPACE to confirm", font_medium, WHITE)
+    for ship in SHIP_OPTIONS:
+        render_text(ship['name'], font_medium, WHITE)
+        render_text(ship['desc'], font_small, (200, 200, 200))
+        for stat_name in ship['stats']:
+            render_text(f"{stat_name.capitalize()}: ", font_small, WHITE)
+
+    # HUD text at the start of a game
+    render_text("Score: 0", font_small, WHITE)
+    render_text("Level: 1", font_small, WHITE)
+    render_text("Bullets: Single", font_small, WHITE)
+    render_text("Bullets: Double", font_small, WHITE)
+
+    # Bullets, stars and damage particles
+    get_bullet_surface(4, 15, YELLOW)
+    for radius in range(1, 3):
+        for brightness in range(205, 256):
+            get_circle_surface(radius, (brightness, brightness, brightness))
+    for size in range(1, 4):
+        for alpha in range(0, 256, PARTICLE_ALPHA_STEP):
+            get_particle_surface(size, RED, alpha)
+
+def print_startup_report():
+    print("Startup timing:")
+    for phase in ('import', 'init', 'fonts', 'first_frame', 'total'):
+        print(f"  {phase:<12} {startup_times.get(phase, 0) * 1000:8.1f} ms")
 
 # Global variables
 score = 0
@@ -49,6 +578,7 @@ class Star:
         self.size = random.random() * 2 + 0.5
         self.speed = random.random() * 0.5 + 0.1
         self.brightness = random.randint(205, 255)  # 205-255 for bright stars
+        self.color = (self.brightness, self.brightness, self.brightness)
         
     def update(self):
         self.y += self.speed
@@ -56,9 +586,11 @@ class Star:
             self.y = 0
             self.x = random.randint(0, WIDTH)
             
-    def draw(self, surface):
-        pygame.draw.circle(surface, (self.brightness, self.brightness, self.brightness), 
-                          (int(self.x), int(self.y)), int(self.size))
+    def draw(self, render_queue):
+        radius = int(self.size)
+        if radius > 0:
+            render_queue.submit(LAYER_STARS, get_circle_surface(radius, self.color),
+                                (int(self.x) - radius, int(self.y) - radius))
 
 class Player:
     def __init__(self, ship_type='fighter'):
@@ -95,6 +627,7 @@ class Player:
         self.invulnerable_time = 0
         self.invulnerable_duration = 1000  # milliseconds
         self.ship_type = ship_type
+        self.invulnerable_color = tuple(int(c * 0.5) for c in self.color)
 
     def update(self, keys, current_time):
         # Movement
@@ -116,52 +649,57 @@ class Player:
         if self.invulnerable and current_time - self.invulnerable_time > self.invulnerable_duration:
             self.invulnerable = False
 
-    def draw(self, surface):
+    def draw(self, render_queue):
         # Base color with invulnerability effect
-        color = tuple(int(c * 0.5) for c in self.color) if self.invulnerable else self.color
+        color = self.invulnerable_color if self.invulnerable else self.color
         
-        # Draw ship based on type
+        sprite = get_sprite(('player', self.ship_type, color), (self.width + 1, self.height + 16),
+                            self.draw_ship, color)
+        render_queue.submit(LAYER_PLAYER, sprite, (self.x, self.y))
+
+    def draw_ship(self, surface, color):
+        # Draw ship based on type (relative to the sprite's top left corner)
         if self.ship_type == 'scout':
             # Sleek, narrow ship
             pygame.draw.polygon(surface, color, [
-                (self.x + self.width // 2, self.y),
-                (self.x + self.width - 10, self.y + self.height),
-                (self.x + 10, self.y + self.height)
+                (self.width // 2, 0),
+                (self.width - 10, self.height),
+                (10, self.height)
             ])
             
             # Scout details
             pygame.draw.rect(surface, (39, 174, 96), 
-                            (self.x + self.width // 2 - 3, self.y + 15, 6, 5))
+                            (self.width // 2 - 3, 15, 6, 5))
             
         elif self.ship_type == 'tank':
             # Wide, bulky ship
             pygame.draw.polygon(surface, color, [
-                (self.x + self.width // 2, self.y + 10),
-                (self.x + self.width, self.y + self.height),
-                (self.x, self.y + self.height)
+                (self.width // 2, 10),
+                (self.width, self.height),
+                (0, self.height)
             ])
             
             # Tank details
             pygame.draw.rect(surface, (192, 57, 43), 
-                            (self.x + self.width // 2 - 10, self.y + 20, 20, 8))
+                            (self.width // 2 - 10, 20, 20, 8))
             
         else:  # fighter or default
             # Standard balanced ship
             pygame.draw.polygon(surface, color, [
-                (self.x + self.width // 2, self.y),
-                (self.x + self.width, self.y + self.height),
-                (self.x, self.y + self.height)
+                (self.width // 2, 0),
+                (self.width, self.height),
+                (0, self.height)
             ])
             
             # Fighter details
             pygame.draw.rect(surface, (41, 128, 185), 
-                            (self.x + self.width // 2 - 5, self.y + 10, 10, 5))
+                            (self.width // 2 - 5, 10, 10, 5))
 
         # Draw engine flames (common to all ships)
         pygame.draw.polygon(surface, ORANGE, [
-            (self.x + 10, self.y + self.height),
-            (self.x + 20, self.y + self.height + 15),
-            (self.x + 30, self.y + self.height)
+            (10, self.height),
+            (20, self.height + 15),
+            (30, self.height)
         ])
 
     def shoot(self, bullets):
@@ -216,13 +754,10 @@ class Bullet:
     def update(self):
         self.y -= self.speed
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, (self.x - self.width // 2, self.y, self.width, self.height))
-        
-        # Create a glow effect (simplified)
-        glow_surf = pygame.Surface((self.width + 6, self.height + 6), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, (*self.color, 100), (3, 3, self.width, self.height))
-        surface.blit(glow_surf, (self.x - self.width // 2 - 3, self.y - 3))
+    def draw(self, render_queue):
+        # Bullet with its glow
+        render_queue.submit(LAYER_BULLETS, get_bullet_surface(self.width, self.height, self.color),
+                            (self.x - self.width // 2 - 3, self.y - 3))
 
 class Enemy:
     def __init__(self, level):
@@ -255,37 +790,47 @@ class Enemy:
             if self.x > WIDTH - self.width:
                 self.x = WIDTH - self.width
 
-    def draw(self, surface):
-        # Draw enemy ship based on type
+    def draw(self, render_queue):
+        sprite = get_sprite(('enemy', self.type, self.color), (self.width + 1, self.height + 1),
+                            self.draw_ship)
+        render_queue.submit(LAYER_ENEMIES, sprite, (self.x, self.y))
+        
+        # Draw health bar
+        health_percentage = self.health / self.max_health
+        bar_width = self.width
+        bar_height = 4
+        fill_width = int(bar_width * health_percentage)
+        bar_color = GREEN if health_percentage > 0.5 else RED
+        
+        bar = get_sprite(('enemy_health', bar_width, bar_height, fill_width, bar_color), (bar_width, bar_height),
+                         self.draw_health_bar, fill_width, bar_color)
+        render_queue.submit(LAYER_ENEMIES, bar, (self.x, self.y - 10))
+
+    def draw_ship(self, surface):
+        # Draw enemy ship based on type (relative to the sprite's top left corner)
         if self.type == 'advanced':
             # Advanced enemy design (diamond shape)
             pygame.draw.polygon(surface, self.color, [
-                (self.x + self.width // 2, self.y),
-                (self.x + self.width, self.y + self.height // 2),
-                (self.x + self.width // 2, self.y + self.height),
-                (self.x, self.y + self.height // 2)
+                (self.width // 2, 0),
+                (self.width, self.height // 2),
+                (self.width // 2, self.height),
+                (0, self.height // 2)
             ])
             
             # Advanced enemy details
             pygame.draw.circle(surface, (255, 255, 255), 
-                              (int(self.x + self.width // 2), int(self.y + self.height // 2)), 5)
+                              (self.width // 2, self.height // 2), 5)
         else:
             # Basic enemy design (triangle)
             pygame.draw.polygon(surface, self.color, [
-                (self.x + self.width // 2, self.y + self.height),
-                (self.x + self.width, self.y),
-                (self.x, self.y)
+                (self.width // 2, self.height),
+                (self.width, 0),
+                (0, 0)
             ])
-        
-        # Draw health bar
-        health_percentage = self.health / self.max_health
-        bar_width = self.width
-        bar_height = 4
-        
-        pygame.draw.rect(surface, (50, 50, 50), (self.x, self.y - 10, bar_width, bar_height))
-        
-        bar_color = GREEN if health_percentage > 0.5 else RED
-        pygame.draw.rect(surface, bar_color, (self.x, self.y - 10, int(bar_width * health_percentage), bar_height))
+
+    def draw_health_bar(self, surface, fill_width, bar_color):
+        surface.fill((50, 50, 50))
+        pygame.draw.rect(surface, bar_color, (0, 0, fill_width, surface.get_height()))
 
     def take_damage(self, amount, particles):
         self.health -= amount
@@ -326,14 +871,11 @@ class Particle:
         
         return age < self.lifespan
 
-    def draw(self, surface):
+    def draw(self, render_queue):
         if self.opacity > 0:
-            # Create a surface with per-pixel alpha
-            s = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            # Draw the circle with alpha
-            pygame.draw.circle(s, (*self.color, int(self.opacity)), (int(self.size), int(self.size)), int(self.size))
-            # Blit the surface onto the screen
-            surface.blit(s, (int(self.x - self.size), int(self.y - self.size)))
+            # Cached surface with the circle drawn in per-pixel alpha
+            s = get_particle_surface(self.size, self.color, self.opacity)
+            render_queue.submit(LAYER_PARTICLES, s, (int(self.x - self.size), int(self.y - self.size)))
 
 def create_explosion(x, y, color, particles):
     # Create explosion particles
@@ -350,7 +892,7 @@ def create_explosion(x, y, color, particles):
         ))
 
 def draw_text(surface, text, font, color, x, y, align="left"):
-    text_surface = font.render(str(text), True, color)
+    text_surface = render_text(str(text), font, color)
     text_rect = text_surface.get_rect()
     
     if align == "center":
@@ -364,6 +906,7 @@ def draw_text(surface, text, font, color, x, y, align="left"):
         text_rect.y = y
         
     surface.blit(text_surface, text_rect)
+    render_queue.count_draws()
 
 def draw_health_bar(surface, x, y, width, height, value, max_value):
     # Background
@@ -381,6 +924,7 @@ def draw_health_bar(surface, x, y, width, height, value, max_value):
         color = RED
         
     pygame.draw.rect(surface, color, (x, y, fill_width, height))
+    render_queue.count_draws(2)
     
     # Health text
     health_text = f"{int(value)}/{max_value}"
@@ -459,44 +1003,391 @@ def create_stars():
         stars.append(Star())
     return stars
 
-def show_ship_selection(surface):
-    """Show ship selection screen and return the selected ship type"""
-    # Ship options
-    ships = [
-        {
-            'type': 'fighter',
-            'name': 'Fighter',
-            'desc': 'Balanced',
-            'color': BLUE,
-            'stats': {
-                'speed': 3,
-                'health': 3,
-                'damage': 3
-            }
-        },
-        {
-            'type': 'scout',
-            'name': 'Scout',
-            'desc': 'Fast & Agile',
-            'color': GREEN,
-            'stats': {
-                'speed': 5,
-                'health': 2,
-                'damage': 2
-            }
-        },
-        {
-            'type': 'tank',
-            'name': 'Tank',
-            'desc': 'Heavy & Powerful',
-            'color': RED,
-            'stats': {
-                'speed': 2,
-                'health': 5,
-                'damage': 4
-            }
+def format_run(sequence, run):
+    score, level, ship_type, duration = run
+    return f"{sequence}\t{score}\t{level}\t{ship_type}\t{duration:.1f}\n"
+
+def parse_run(line):
+    """Return (sequence number, run) for a log line"""
+    if not line.endswith("\n"):
+        raise ValueError("incomplete line")  # Interrupted write
+    sequence, score, level, ship_type, duration = line[:-1].split("\t")
+    return int(sequence), (int(score), int(level), ship_type, float(duration))
+
+def snapshot_run(values):
+    score, level, ship_type, duration = values
+    return int(score), int(level), str(ship_type), float(duration)
+
+class Leaderboard:
+    """Every finished run, kept in an append-only log with rankings indexed in memory
+
+    Runs are (score, level, ship type, duration) tuples. The log is periodically
+    folded into a snapshot holding the number of runs per ship and score, plus the
+    best runs for each ship, so loading stays fast however many games are played.
+    Log lines carry a sequence number and the snapshot records the last one it
+    includes, so runs left in the log by an interrupted compaction are not counted
+    twice. Loading and all disk writes happen on a background thread.
+    """
+    def __init__(self, log_path, snapshot_path, compact_every=LEADERBOARD_COMPACT_EVERY):
+        self.log_path = log_path
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every
+        self.total = 0
+        self.counts = {}  # ship type -> {score: number of runs}
+        self.top = []  # Min-heap of the best runs overall
+        self.top_by_ship = {}  # ship type -> min-heap of its best runs
+        self.log_runs = 0  # Runs in the log since the last compaction
+        self.sequence = 0  # Sequence number of the last recorded run
+        self.load_time = 0.0
+        
+        self.loaded = threading.Event()
+        self.jobs = queue.Queue()
+        self.writer = threading.Thread(target=self.run_writer, daemon=True)
+        self.writer.start()
+
+    def push_top(self, run):
+        for heap in (self.top, self.top_by_ship.setdefault(run[2], [])):
+            if len(heap) < LEADERBOARD_TOP_K:
+                heapq.heappush(heap, run)
+            else:
+                heapq.heappushpop(heap, run)
+
+    def add(self, run):
+        score, level, ship_type, duration = run
+        counts = self.counts.setdefault(ship_type, {})
+        counts[score] = counts.get(score, 0) + 1
+        self.total += 1
+        self.push_top(run)
+
+    def load(self):
+        start = time.perf_counter()
+        try:
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+            # Check everything before using any of it, so a damaged file leaves the board empty
+            counts = {str(ship_type): {int(score): int(count) for score, count in ship_counts.items()}
+                      for ship_type, ship_counts in snapshot['counts'].items()}
+            top = [snapshot_run(run) for run in snapshot['top']]
+            sequence = int(snapshot['sequence'])
+            self.counts = counts
+            self.sequence = sequence
+            self.total = sum(sum(ship_counts.values()) for ship_counts in counts.values())
+            for run in top:
+                self.push_top(run)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # No usable snapshot, rebuild from the log alone
+        
+        try:
+            self.repair_log()
+            with open(self.log_path) as f:
+                for line in f:
+                    try:
+                        sequence, run = parse_run(line)
+                    except ValueError:
+                        continue
+                    if sequence <= self.sequence:
+                        continue  # Already folded into the snapshot
+                    self.add(run)
+                    self.sequence = sequence
+                    self.log_runs += 1
+        except OSError:
+            pass
+        self.load_time = time.perf_counter() - start
+
+    def repair_log(self):
+        """Cut off a line torn by an interrupted write, so the next append starts on a new line"""
+        with open(self.log_path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            
+            # Search backwards for the end of the last complete line
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    f.truncate(start + newline + 1)
+                    return
+                end = start
+            f.truncate(0)
+
+    def snapshot(self):
+        return {
+            'counts': {ship_type: dict(ship_counts) for ship_type, ship_counts in self.counts.items()},
+            'top': [run for heap in self.top_by_ship.values() for run in heap],
+            'sequence': self.sequence
         }
+
+    def run_writer(self):
+        # Queries wait for loading, so they must be released even if it fails
+        try:
+            self.load()
+        except Exception as e:
+            print(f"Could not load leaderboard: {e}")
+        finally:
+            self.loaded.set()
+        
+        running = True
+        while running:
+            # Handle every job that is already waiting in one go
+            jobs = [self.jobs.get()]
+            while True:
+                try:
+                    jobs.append(self.jobs.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Jobs are lines to append, snapshots to compact into, or None to stop
+            lines = []
+            for job in jobs:
+                if isinstance(job, str):
+                    lines.append(job)
+                    continue
+                self.write(lines, job)
+                lines = []
+                if job is None:
+                    running = False
+            self.write(lines, None)
+
+    def write(self, lines, snapshot):
+        if not lines and snapshot is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            if lines:
+                with open(self.log_path, 'a') as f:
+                    f.writelines(lines)
+            if snapshot is not None:
+                # The snapshot replaces the log, so write it fully before emptying the log.
+                # If the log is not emptied, load() skips the lines the snapshot already covers.
+                temp_path = self.snapshot_path + ".tmp"
+                with open(temp_path, 'w') as f:
+                    json.dump(snapshot, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.snapshot_path)
+                open(self.log_path, 'w').close()
+        except OSError as e:
+            print(f"Could not save leaderboard: {e}")
+
+    def record(self, score, level, ship_type, duration):
+        """Add a finished run; it is written to disk in the background"""
+        self.loaded.wait()
+        run = (score, level, ship_type, round(duration, 1))
+        self.add(run)
+        self.sequence += 1
+        self.jobs.put(format_run(self.sequence, run))
+        
+        self.log_runs += 1
+        if self.log_runs >= self.compact_every:
+            self.jobs.put(self.snapshot())
+            self.log_runs = 0
+
+    def rank(self, score, ship_type=None):
+        """Return (rank, number of runs) for score, overall or among runs with ship_type"""
+        self.loaded.wait()
+        ship_types = self.counts if ship_type is None else [ship_type]
+        better = 0
+        total = 0
+        for ship in ship_types:
+            for other_score, count in self.counts.get(ship, {}).items():
+                total += count
+                if other_score > score:
+                    better += count
+        return better + 1, total
+
+    def best(self, ship_type=None, n=LEADERBOARD_SHOWN):
+        """Return the n best runs, overall or with ship_type"""
+        self.loaded.wait()
+        heap = self.top if ship_type is None else self.top_by_ship.get(ship_type, [])
+        return heapq.nlargest(n, heap)
+
+    def close(self):
+        """Wait for pending writes to finish"""
+        self.jobs.put(None)
+        self.writer.join()
+
+def benchmark_leaderboard(runs):
+    """Time recording, loading and querying a leaderboard of random runs"""
+    if runs < 1:
+        raise ValueError("the number of runs must be at least 1")
+    with tempfile.TemporaryDirectory() as directory:
+        for compact_every in (LEADERBOARD_COMPACT_EVERY, runs + 1):
+            log_path = os.path.join(directory, f"scores-{compact_every}.log")
+            snapshot_path = os.path.join(directory, f"scores-{compact_every}.json")
+            
+            board = Leaderboard(log_path, snapshot_path, compact_every)
+            start = time.perf_counter()
+            for _ in range(runs):
+                ship = random.choice(SHIP_OPTIONS)['type']
+                level = random.randint(1, 20)
+                board.record(level * LEVEL_UP_SCORE - random.randint(1, 10) * ENEMY_POINTS,
+                             level, ship, random.random() * 600)
+            board.close()
+            record_time = time.perf_counter() - start
+            
+            board = Leaderboard(log_path, snapshot_path, compact_every)
+            board.loaded.wait()
+            
+            queries = 1000
+            start = time.perf_counter()
+            for _ in range(queries):
+                score = random.randint(0, 20) * LEVEL_UP_SCORE
+                ship = random.choice(SHIP_OPTIONS)['type']
+                board.rank(score)
+                board.rank(score, ship)
+                board.best()
+                board.best(ship)
+            query_time = (time.perf_counter() - start) / queries
+            board.close()
+            
+            compaction = "with compaction" if compact_every <= runs else "without compaction"
+            print(f"Leaderboard, {runs} runs {compaction}:")
+            print(f"  record     {record_time / runs * 1e6:8.2f} us/run")
+            print(f"  load       {board.load_time * 1000:8.1f} ms")
+            print(f"  game over  {query_time * 1e6:8.2f} us (2 ranks + 2 top lists)")
+
+class StaticLayer:
+    """Pre-composited part of a screen that is only redrawn when its state changes"""
+    def __init__(self, draw_func):
+        self.draw_func = draw_func
+        self.state = None
+        self.surface = None
+        self.pos = (0, 0)
+
+    def draw(self, surface, state=None):
+        if self.surface is None or state != self.state:
+            layer = pygame.Surface(LAYOUT_SIZE, pygame.SRCALPHA)
+            self.draw_func(layer, state)
+            if LAYOUT_SCALE > 1:
+                layer = pygame.transform.smoothscale(layer, (WIDTH, HEIGHT))
+            
+            # Only keep the area that was drawn on
+            rect = layer.get_bounding_rect()
+            self.surface = layer.subsurface(rect).convert_alpha()
+            self.pos = rect.topleft
+            self.state = state
+        surface.blit(self.surface, self.pos)
+        render_queue.count_draws()
+
+def draw_ship_selection_layer(surface, selected_index):
+    width, height = surface.get_size()
+    
+    # Draw title
+    draw_text(surface, "SELECT YOUR SHIP", font_large, BLUE, width // 2, 50, "center")
+    
+    # Draw instructions
+    draw_text(surface, "← → to select, SPACE to confirm", font_medium, WHITE, width // 2, height - 50, "center")
+    
+    # Draw ship options
+    ship_width = 180
+    total_width = len(SHIP_OPTIONS) * ship_width
+    start_x = (width - total_width) // 2
+    
+    for i, ship in enumerate(SHIP_OPTIONS):
+        x = start_x + i * ship_width
+        y = height // 2 - 100
+        
+        # Draw selection box
+        box_color = (100, 100, 100)
+        if i == selected_index:
+            box_color = (200, 200, 100)
+        
+        pygame.draw.rect(surface, box_color, (x, y, ship_width, 200), 0, 10)
+        pygame.draw.rect(surface, ship['color'], (x, y, ship_width, 200), 3, 10)
+        
+        # Draw ship name
+        draw_text(surface, ship['name'], font_medium, WHITE, x + ship_width // 2, y + 20, "center")
+        
+        # Draw ship description
+        draw_text(surface, ship['desc'], font_small, (200, 200, 200), x + ship_width // 2, y + 50, "center")
+        
+        # Draw ship preview
+        ship_preview_y = y + 80
+        if ship['type'] == 'fighter':
+            pygame.draw.polygon(surface, ship['color'], [
+                (x + ship_width // 2, ship_preview_y),
+                (x + ship_width // 2 + 25, ship_preview_y + 50),
+                (x + ship_width // 2 - 25, ship_preview_y + 50)
+            ])
+        elif ship['type'] == 'scout':
+            pygame.draw.polygon(surface, ship['color'], [
+                (x + ship_width // 2, ship_preview_y),
+                (x + ship_width // 2 + 15, ship_preview_y + 60),
+                (x + ship_width // 2 - 15, ship_preview_y + 60)
+            ])
+        elif ship['type'] == 'tank':
+            pygame.draw.polygon(surface, ship['color'], [
+                (x + ship_width // 2, ship_preview_y + 10),
+                (x + ship_width // 2 + 30, ship_preview_y + 50),
+                (x + ship_width // 2 - 30, ship_preview_y + 50)
+            ])
+        
+        # Draw stats
+        stat_y = y + 140
+        for j, (stat_name, stat_value) in enumerate(ship['stats'].items()):
+            draw_text(surface, f"{stat_name.capitalize()}: ", font_small, WHITE, x + 20, stat_y + j * 20, "left")
+            
+            # Draw stat bars
+            for k in range(5):
+                bar_color = ship['color'] if k < stat_value else (50, 50, 50)
+                pygame.draw.rect(surface, bar_color, (x + 80 + k * 15, stat_y + j * 20, 10, 10))
+
+def draw_start_screen_layer(surface, state):
+    width, height = surface.get_size()
+    
+    # Title
+    draw_text(surface, "SPACE SHOOTER", font_large, BLUE, width // 2, height // 3, "center")
+    
+    # Instructions
+    draw_text(surface, "Use arrow keys or WASD to move", font_medium, WHITE, width // 2, height // 2, "center")
+    draw_text(surface, "Space to shoot (hold for auto-fire)", font_medium, WHITE, width // 2, height // 2 + 40, "center")
+    
+    # Start prompt
+    draw_text(surface, "Press SPACE to continue", font_medium, YELLOW, width // 2, height * 3 // 4, "center")
+
+def draw_game_over_layer(surface, state):
+    width, height = surface.get_size()
+    final_score, ship_type, overall_rank, ship_rank, best_overall, best_ship = state
+    ship_name = SHIP_NAMES.get(ship_type, ship_type)
+    surface.fill((0, 0, 0, 200))
+    
+    # Game Over text
+    draw_text(surface, "GAME OVER", font_large, RED, width // 2, height // 3 - 60, "center")
+    
+    # Score and rankings
+    draw_text(surface, f"Final Score: {final_score}", font_medium, WHITE, width // 2, height // 3 + 10, "center")
+    draw_text(surface, f"Rank #{overall_rank[0]} of {overall_rank[1]} overall, "
+                       f"#{ship_rank[0]} of {ship_rank[1]} as {ship_name}",
+              font_small, (200, 200, 200), width // 2, height // 3 + 45, "center")
+    
+    # Best runs overall and with this ship
+    columns = [
+        (width // 2 - 150, "Top Overall", [f"{score}  {SHIP_NAMES.get(ship, ship)}  L{level}"
+                                           for score, level, ship, duration in best_overall]),
+        (width // 2 + 150, f"Top {ship_name}", [f"{score}  L{level}  {duration:.0f}s"
+                                               for score, level, ship, duration in best_ship])
     ]
+    for x, title, rows in columns:
+        draw_text(surface, title, font_small, YELLOW, x, height // 2, "center")
+        for i, row in enumerate(rows):
+            draw_text(surface, f"{i + 1}. {row}", font_small, WHITE, x, height // 2 + 22 + i * 20, "center")
+    
+    # Restart prompt
+    draw_text(surface, "Press SPACE to play again", font_medium, YELLOW, width // 2, height * 3 // 4, "center")
+
+# Static screen layers, composited over the animated starfield
+ship_selection_layer = StaticLayer(draw_ship_selection_layer)
+start_screen_layer = StaticLayer(draw_start_screen_layer)
+game_over_layer = StaticLayer(draw_game_over_layer)
+
+def show_ship_selection(surface):
+    """Show ship selection screen and return the selected ship type"""
+    ships = SHIP_OPTIONS
     
     selected_index = 0
     
@@ -508,7 +1399,7 @@ def show_ship_selection(surface):
         current_time = pygame.time.get_ticks()
         
         # Handle events
-        for event in pygame.event.get():
+        for event in pacer.get_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -525,94 +1416,42 @@ def show_ship_selection(surface):
         
         # Draw background
         surface.fill(BLACK)
+        render_queue.count_draws()
         
-        # Draw stars
+        # Draw stars (updated once per game frame so they keep their speed)
         for star in stars:
-            star.update()
-            star.draw(surface)
-        
-        # Draw title
-        draw_text(surface, "SELECT YOUR SHIP", font_large, BLUE, WIDTH // 2, 50, "center")
-        
-        # Draw instructions
-        draw_text(surface, "← → to select, SPACE to confirm", font_medium, WHITE, WIDTH // 2, HEIGHT - 50, "center")
-        
-        # Draw ship options
-        ship_width = 180
-        total_width = len(ships) * ship_width
-        start_x = (WIDTH - total_width) // 2
-        
-        for i, ship in enumerate(ships):
-            x = start_x + i * ship_width
-            y = HEIGHT // 2 - 100
-            
-            # Draw selection box
-            box_color = (100, 100, 100)
-            if i == selected_index:
-                box_color = (200, 200, 100)
-            
-            pygame.draw.rect(surface, box_color, (x, y, ship_width, 200), 0, 10)
-            pygame.draw.rect(surface, ship['color'], (x, y, ship_width, 200), 3, 10)
-            
-            # Draw ship name
-            draw_text(surface, ship['name'], font_medium, WHITE, x + ship_width // 2, y + 20, "center")
-            
-            # Draw ship description
-            draw_text(surface, ship['desc'], font_small, (200, 200, 200), x + ship_width // 2, y + 50, "center")
-            
-            # Draw ship preview
-            ship_preview_y = y + 80
-            if ship['type'] == 'fighter':
-                pygame.draw.polygon(surface, ship['color'], [
-                    (x + ship_width // 2, ship_preview_y),
-                    (x + ship_width // 2 + 25, ship_preview_y + 50),
-                    (x + ship_width // 2 - 25, ship_preview_y + 50)
-                ])
-            elif ship['type'] == 'scout':
-                pygame.draw.polygon(surface, ship['color'], [
-                    (x + ship_width // 2, ship_preview_y),
-                    (x + ship_width // 2 + 15, ship_preview_y + 60),
-                    (x + ship_width // 2 - 15, ship_preview_y + 60)
-                ])
-            elif ship['type'] == 'tank':
-                pygame.draw.polygon(surface, ship['color'], [
-                    (x + ship_width // 2, ship_preview_y + 10),
-                    (x + ship_width // 2 + 30, ship_preview_y + 50),
-                    (x + ship_width // 2 - 30, ship_preview_y + 50)
-                ])
-            
-            # Draw stats
-            stat_y = y + 140
-            for j, (stat_name, stat_value) in enumerate(ship['stats'].items()):
-                draw_text(surface, f"{stat_name.capitalize()}: ", font_small, WHITE, x + 20, stat_y + j * 20, "left")
-                
-                # Draw stat bars
-                for k in range(5):
-                    bar_color = ship['color'] if k < stat_value else (50, 50, 50)
-                    pygame.draw.rect(surface, bar_color, (x + 80 + k * 15, stat_y + j * 20, 10, 10))
+            for _ in range(FPS // MENU_FPS):
+                star.update()
+            star.draw(render_queue)
+        render_queue.flush(surface)
+        
+        # Title, instructions and ship cards (rebuilt when the selection changes)
+        ship_selection_layer.draw(surface, selected_index)
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        present()
+        pacer.tick(MENU_FPS)
     
     return ships[selected_index]['type']
 
 def show_start_screen(surface):
+    frame_start = time.perf_counter()
     surface.fill(BLACK)
+    render_queue.count_draws()
     
     # Create stars for background
     stars = create_stars()
     
-    # Title
-    draw_text(surface, "SPACE SHOOTER", font_large, BLUE, WIDTH // 2, HEIGHT // 3, "center")
-    
-    # Instructions
-    draw_text(surface, "Use arrow keys or WASD to move", font_medium, WHITE, WIDTH // 2, HEIGHT // 2, "center")
-    draw_text(surface, "Space to shoot (hold for auto-fire)", font_medium, WHITE, WIDTH // 2, HEIGHT // 2 + 40, "center")
+    # Title and instructions
+    start_screen_layer.draw(surface)
     
-    # Start prompt
-    draw_text(surface, "Press SPACE to continue", font_medium, YELLOW, WIDTH // 2, HEIGHT * 3 // 4, "center")
+    present()
+    startup_times['first_frame'] = time.perf_counter() - frame_start
+    startup_times['total'] = time.perf_counter() - _startup_start
+    if STARTUP_REPORT:
+        print_startup_report()
     
-    pygame.display.flip()
+    # Warm up the remaining fonts and caches while the player reads the start screen
+    threading.Thread(target=prewarm_caches, daemon=True).start()
     
     # Wait for player to press space
     waiting = True
@@ -621,19 +1460,19 @@ def show_start_screen(surface):
         
         # Update and draw stars
         surface.fill(BLACK)
+        render_queue.count_draws()
         for star in stars:
-            star.update()
-            star.draw(surface)
+            for _ in range(FPS // MENU_FPS):
+                star.update()
+            star.draw(render_queue)
+        render_queue.flush(surface)
             
         # Redraw text
-        draw_text(surface, "SPACE SHOOTER", font_large, BLUE, WIDTH // 2, HEIGHT // 3, "center")
-        draw_text(surface, "Use arrow keys or WASD to move", font_medium, WHITE, WIDTH // 2, HEIGHT // 2, "center")
-        draw_text(surface, "Space to shoot (hold for auto-fire)", font_medium, WHITE, WIDTH // 2, HEIGHT // 2 + 40, "center")
-        draw_text(surface, "Press SPACE to continue", font_medium, YELLOW, WIDTH // 2, HEIGHT * 3 // 4, "center")
+        start_screen_layer.draw(surface)
         
-        pygame.display.flip()
+        present()
         
-        for event in pygame.event.get():
+        for event in pacer.get_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -644,29 +1483,22 @@ def show_start_screen(surface):
                     pygame.quit()
                     sys.exit()
                     
-        clock.tick(FPS)
+        pacer.tick(MENU_FPS)
 
-def show_game_over_screen(surface):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    surface.blit(overlay, (0, 0))
-    
-    # Game Over text
-    draw_text(surface, "GAME OVER", font_large, RED, WIDTH // 2, HEIGHT // 3, "center")
-    
-    # Score
-    draw_text(surface, f"Final Score: {score}", font_medium, WHITE, WIDTH // 2, HEIGHT // 2, "center")
+def show_game_over_screen(surface, ship_type):
+    # Dimmed overlay with the final score and rankings
+    state = (score, ship_type, leaderboard.rank(score), leaderboard.rank(score, ship_type),
+             tuple(leaderboard.best()), tuple(leaderboard.best(ship_type)))
+    game_over_layer.draw(surface, state)
     
-    # Restart prompt
-    draw_text(surface, "Press SPACE to play again", font_medium, YELLOW, WIDTH // 2, HEIGHT * 3 // 4, "center")
+    present()
     
-    pygame.display.flip()
-    
-    # Wait for player to press space
+    # Nothing moves on this screen, so sleep until there is input
     waiting = True
     while waiting:
-        clock.tick(FPS)
-        for event in pygame.event.get():
+        for event in pacer.wait_events():
+            if event.type == pygame.WINDOWEXPOSED:
+                present()
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -677,8 +1509,16 @@ def show_game_over_screen(surface):
                     pygame.quit()
                     sys.exit()
 
+# Created by main() so the run history loads while the game starts up
+leaderboard = None
+
 def main():
-    global score, level
+    global score, level, leaderboard
+    
+    leaderboard = Leaderboard(LEADERBOARD_LOG, LEADERBOARD_SNAPSHOT)
+    atexit.register(leaderboard.close)
+    
+    init_display()
     
     # Show start screen
     show_start_screen(screen)
@@ -704,13 +1544,16 @@ def main():
         shoot_interval = 150  # milliseconds (decreased from 300 to 150 for faster shooting)
         auto_fire = False
         game_over = False
+        game_start = pygame.time.get_ticks()
+        game_start_paused = pacer.paused_time
+        gc_scheduler.begin_play()
         
         # Game loop
         while running and not game_over:
             current_time = pygame.time.get_ticks()
             
             # Handle events
-            for event in pygame.event.get():
+            for event in pacer.get_events():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -769,29 +1612,33 @@ def main():
             
             # Draw everything
             screen.fill(BLACK)
+            render_queue.count_draws()
             
-            # Draw stars (background)
+            # Queue stars (background)
             for star in stars:
-                star.draw(screen)
+                star.draw(render_queue)
             
-            # Draw particles (behind everything)
+            # Queue particles (behind everything)
             for particle in particles:
-                particle.draw(screen)
+                particle.draw(render_queue)
             
-            # Draw bullets
+            # Queue bullets
             for bullet in bullets:
-                bullet.draw(screen)
+                bullet.draw(render_queue)
             
-            # Draw enemies
+            # Queue enemies
             for enemy in enemies:
-                enemy.draw(screen)
+                enemy.draw(render_queue)
+            
+            # Queue player
+            player.draw(render_queue)
             
-            # Draw player
-            player.draw(screen)
+            # Draw all queued sprites, one layer at a time
+            render_queue.flush(screen)
             
             # Draw HUD
             # Health bar
-            draw_health_bar(screen, 10, 10, 200, 20, player.health, player.max_health)
+            draw_health_bar(screen, 10, 10, min(200, WIDTH // 4), 20, player.health, player.max_health)
             
             # Score and level
             draw_text(screen, f"Score: {score}", font_small, WHITE, WIDTH // 2, 15, "center")
@@ -804,17 +1651,29 @@ def main():
             draw_text(screen, f"Regen: {player.regen_rate:.1f} HP/s", font_small, WHITE, WIDTH - 10, 55, "right")
             
             # Update display
-            pygame.display.flip()
+            present()
             
-            # Cap the frame rate
-            clock.tick(FPS)
+            # Cap the frame rate (paused while the window is in the background)
+            pacer.tick(FPS, pause_unfocused=True)
+        
+        gc_scheduler.end_play()
+        
+        # Time spent paused in the background is not play time
+        duration = pygame.time.get_ticks() - game_start - (pacer.paused_time - game_start_paused)
+        leaderboard.record(score, level, ship_type, duration / 1000)
         
         # Show game over screen
         if game_over:
-            show_game_over_screen(screen)
+            show_game_over_screen(screen, ship_type)
     
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
+    if BENCHMARK_RUNS is not None:
+        try:
+            benchmark_leaderboard(int(BENCHMARK_RUNS))
+        except ValueError as e:
+            sys.exit(f"--benchmark-leaderboard: {e}")
+    else:
+        main()